@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+In-process validation checks for the AI Agent Framework.
+
+Runs the checks that only need a Python interpreter — the unit test suite and
+the package import validation — inside one process, so validate_before_push.py
+pays interpreter startup and project imports once instead of per check.
+"""
+
+import sys
+
+import pytest
+
+
+def run_test_suite() -> bool:
+    """Run the full test suite via pytest in this process.
+
+    pytest collects both the unittest classes and the plain test functions;
+    unittest discovery would silently skip the latter.
+    """
+    print("\n🔍 Unit Test Suite")
+    return pytest.main(["tests"]) == 0
+
+
+def run_import_validation() -> bool:
+    """Validate that the package modules import cleanly."""
+    print("\n🔍 Package Import Validation")
+    try:
+        from src import config, main, models, tools  # noqa: F401
+    except Exception as e:
+        print(f"❌ Import failed: {e}")
+        return False
+    print("All imports successful")
+    return True
+
+
+def main() -> int:
+    """Run the in-process checks and report a combined exit code."""
+    checks = [run_test_suite, run_import_validation]
+    return 0 if all([check() for check in checks]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""
+Pytest session configuration for the AI Agent Framework.
+
+Makes the project root importable once per session so individual test modules
+do not need their own sys.path manipulation at collection time.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# Snapshot the registry now, at conftest import — before collection imports
+# tests/__init__, which registers the shared test tools as a side effect.
+# src/__init__ re-exports the tools dict under the same name as the module,
+# so the registries are bound directly rather than via src.tools
+from src.tools import tools, tools_by_tag  # noqa: E402
+
+_TOOLS_SNAPSHOT = dict(tools)
+_TAGS_SNAPSHOT = {tag: list(names) for tag, names in tools_by_tag.items()}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _register_test_tools():
+    """Ensure the shared test tools are registered for the session.
+
+    Importing tests._tool_fixtures is normally a no-op here because
+    tests/__init__ already did it during collection; the teardown restores
+    the registry to the pre-collection snapshot taken above, so a session
+    leaves the global state exactly as importing src.tools created it.
+    """
+    import tests._tool_fixtures  # noqa: F401
+
+    yield
+
+    tools.clear()
+    tools.update(_TOOLS_SNAPSHOT)
+    tools_by_tag.clear()
+    tools_by_tag.update(_TAGS_SNAPSHOT)
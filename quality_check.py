@@ -4,77 +4,83 @@ Quality check script for the AI Agent Framework.
 Run this script to check code formatting, linting, and import sorting.
 """
 
+import shlex
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def run_command(command: str, description: str) -> bool:
-    """Run a command and return True if successful."""
-    print(f"\n🔍 {description}")
-    print(f"Running: {command}")
-    
+def run_command(command: str, description: str) -> tuple:
+    """Run a command and return (success, report text)."""
+    lines = [f"\n🔍 {description}", f"Running: {command}"]
+
     try:
         result = subprocess.run(
-            command.split(),
+            shlex.split(command),
             cwd=Path(__file__).parent,
             capture_output=True,
             text=True
         )
-        
+
         if result.returncode == 0:
-            print(f"✅ {description} passed")
-            return True
+            lines.append(f"✅ {description} passed")
+            return True, "\n".join(lines)
         else:
-            print(f"❌ {description} failed")
-            print(f"Error output:\n{result.stdout}\n{result.stderr}")
-            return False
-            
+            lines.append(f"❌ {description} failed")
+            lines.append(f"Error output:\n{result.stdout}\n{result.stderr}")
+            return False, "\n".join(lines)
+
     except Exception as e:
-        print(f"❌ Error running {description}: {e}")
-        return False
+        lines.append(f"❌ Error running {description}: {e}")
+        return False, "\n".join(lines)
 
 
 def main():
     """Run all quality checks."""
     print("🚀 Running AI Agent Framework Quality Checks")
     print("=" * 50)
-    
+
     # Find Python executable
     venv_python = Path(__file__).parent / ".venv" / "bin" / "python"
     if venv_python.exists():
         python_cmd = str(venv_python)
     else:
         python_cmd = "python"
-    
+
     checks = [
-        (f"{python_cmd} -m flake8 src/ --count --max-complexity=10 --max-line-length=127 --statistics", 
+        (f"{python_cmd} -m flake8 src/ --count --max-complexity=10 --max-line-length=127 --statistics",
          "Flake8 linting"),
-        (f"{python_cmd} -m black --check src/ tests/", 
+        (f"{python_cmd} -m black --check src/ tests/",
          "Black code formatting"),
-        (f"{python_cmd} -m isort --check-only src/ tests/", 
+        (f"{python_cmd} -m isort --check-only src/ tests/",
          "Import sorting (isort)"),
-        (f"{python_cmd} -m unittest discover tests/ -v", 
+        (f"{python_cmd} -m pytest tests/",
          "Unit test suite"),
     ]
-    
+
+    # The checks are independent subprocesses, so run them concurrently and
+    # report in submission order; wall time is the slowest check, not the sum
     results = []
-    for command, description in checks:
-        success = run_command(command, description)
-        results.append((description, success))
-    
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [executor.submit(run_command, command, description) for command, description in checks]
+        for (command, description), future in zip(checks, futures):
+            success, report = future.result()
+            print(report)
+            results.append((description, success))
+
     # Summary
     print("\n" + "=" * 50)
     print("📊 QUALITY CHECK SUMMARY")
     print("=" * 50)
-    
+
     all_passed = True
     for description, success in results:
         status = "✅ PASSED" if success else "❌ FAILED"
         print(f"{description:<25} {status}")
         if not success:
             all_passed = False
-    
+
     if all_passed:
         print("\n🎉 All quality checks passed! Your code is ready for CI/CD.")
         return 0
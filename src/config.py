@@ -9,24 +9,36 @@ from typing import Any, Dict
 
 MODEL_NAME = "anthropic/claude-3-5-sonnet-20241022"
 
+# Environment-backed settings: name -> parser producing the resolved value
+_ENV_SETTINGS = {
+    "MAX_TOKENS": lambda: int(os.environ.get("MAX_TOKENS", "1024")),
+    "API_KEY": lambda: os.environ.get("ANTHROPIC_API_KEY"),
+    "MAX_CONCURRENCY": lambda: int(os.environ.get("MAX_CONCURRENCY", "8")),
+    "ENABLE_PROMPT_CACHE": lambda: os.environ.get("ENABLE_PROMPT_CACHE", "false").lower() == "true",
+    "ENABLE_SEMANTIC_CACHE": lambda: os.environ.get("ENABLE_SEMANTIC_CACHE", "false").lower() == "true",
+    "VERBOSE_ERRORS": lambda: os.environ.get("VERBOSE_ERRORS", "false").lower() == "true",
+    "MOCK_LLM_CALLS": lambda: os.environ.get("MOCK_LLM_CALLS", "false").lower() == "true",
+    "TEST_TIMEOUT": lambda: int(os.environ.get("TEST_TIMEOUT", "30")),
+    "VERBOSE_TESTS": lambda: os.environ.get("VERBOSE_TESTS", "false").lower() == "true",
+}
+
 
 class ConfigMeta(type):
-    """Metaclass to provide dynamic attribute access for Config."""
-
-    def __getattribute__(cls, name):
-        """Dynamic class attribute access for environment variables."""
-        if name == "MAX_TOKENS":
-            return int(os.environ.get("MAX_TOKENS", "1024"))
-        elif name == "API_KEY":
-            return os.environ.get("ANTHROPIC_API_KEY")
-        elif name == "MOCK_LLM_CALLS":
-            return os.environ.get("MOCK_LLM_CALLS", "false").lower() == "true"
-        elif name == "TEST_TIMEOUT":
-            return int(os.environ.get("TEST_TIMEOUT", "30"))
-        elif name == "VERBOSE_TESTS":
-            return os.environ.get("VERBOSE_TESTS", "false").lower() == "true"
-        else:
-            return super().__getattribute__(name)
+    """Metaclass that resolves environment-backed settings on first access."""
+
+    def __getattr__(cls, name):
+        """Parse the env var once and cache it as a plain class attribute.
+
+        Unlike __getattribute__, __getattr__ only fires when normal lookup
+        fails, so method lookups and already-resolved settings pay nothing.
+        """
+        try:
+            resolver = _ENV_SETTINGS[name]
+        except KeyError:
+            raise AttributeError(f"type object {cls.__name__!r} has no attribute {name!r}") from None
+        value = resolver()
+        setattr(cls, name, value)
+        return value
 
 
 class Config(metaclass=ConfigMeta):
@@ -1,13 +1,21 @@
 # Core agent classes and main agent logic
 
-import json
+import asyncio
+import logging
 import time
 import traceback
-from typing import Any, Callable, Dict, List
+from typing import Any, Awaitable, Callable, Dict, List
 
+from .config import Config
 from .models import Goal, Prompt
+from .serialization import JSONDecodeError, json_dumps, json_loads
 from .tools import tools
 
+# Separator between goal name and description in the system message
+_GOAL_SEP = "\n" + "-" * 50 + "\n"
+
+logger = logging.getLogger(__name__)
+
 
 class Action:
     """Represents an executable action for the agent"""
@@ -15,7 +23,8 @@ class Action:
     def __init__(self, name: str, function: Callable, description: str, parameters: Dict, terminal: bool = False):
         self.name = name
         self.function = function
-        self.description = description
+        # Truncated once here; descriptions are immutable after registration
+        self.description = description[:1024]
         self.terminal = terminal
         self.parameters = parameters
 
@@ -29,10 +38,13 @@ class ActionRegistry:
 
     def __init__(self):
         self.actions = {}
+        # Bumped on every register so cached views can detect staleness
+        self._version = 0
 
     def register(self, action: Action):
         """Register a new action"""
         self.actions[action.name] = action
+        self._version += 1
 
     def get_action(self, name: str) -> Action:
         """Get an action by name"""
@@ -48,20 +60,37 @@ class Memory:
 
     def __init__(self):
         self.items = []
+        # Message-formatted view kept in lockstep with items so formatting
+        # for the LLM is an O(1) read instead of an O(N) re-mapping per turn
+        self._cached_messages = []
 
     def add_memory(self, memory: dict):
         """Add a memory item to the conversation history"""
         self.items.append(memory)
+        role = "assistant" if memory.get("type") == "assistant" else "user"
+        content = memory.get("content") or json_dumps(memory)
+        self._cached_messages.append({"role": role, "content": content})
 
     def get_memories(self, limit: int = None) -> List[Dict]:
         """Get conversation history, optionally limited"""
         return self.items[:limit] if limit else self.items
 
+    def get_messages(self) -> List[Dict]:
+        """Get the history pre-formatted as LLM chat messages"""
+        return self._cached_messages
+
+    def iter_non_system(self):
+        """Lazily iterate memories, skipping system-type items"""
+        return (m for m in self.items if m.get("type") != "system")
+
     def copy_without_system_memories(self):
         """Return a copy without system-type memories"""
-        filtered_items = [m for m in self.items if m.get("type") != "system"]
+        # Pass-through: no system items means nothing to filter or copy
+        if not any(m.get("type") == "system" for m in self.items):
+            return self
         memory = Memory()
-        memory.items = filtered_items
+        for item in self.iter_non_system():
+            memory.add_memory(item)
         return memory
 
 
@@ -74,7 +103,14 @@ class Environment:
             result = action.execute(**args)
             return self.format_result(result)
         except Exception as e:
-            return {"tool_executed": False, "error": str(e), "traceback": traceback.format_exc()}
+            # Keep the full traceback in the local log, but only feed it back
+            # to the LLM when asked: formatting it walks the whole frame stack
+            # and bloats the context for what are usually validation errors
+            logger.exception("Action %s failed", action.name)
+            error_result = {"tool_executed": False, "error": f"{type(e).__name__}: {e}"}
+            if Config.VERBOSE_ERRORS or isinstance(e, (SystemError, MemoryError)):
+                error_result["traceback"] = traceback.format_exc()
+            return error_result
 
     def format_result(self, result: Any) -> dict:
         """Format action result with metadata"""
@@ -96,40 +132,34 @@ class AgentFunctionCallingActionLanguage(AgentLanguage):
 
     def format_goals(self, goals: List[Goal]) -> List:
         """Format goals into system messages"""
-        sep = "\n" + "-" * 50 + "\n"
-        goal_instructions = "\n\n".join([f"{goal.name}:{sep}{goal.description}{sep}" for goal in goals])
-        return [{"role": "system", "content": goal_instructions}]
+        goal_instructions = "\n\n".join(f"{goal.name}:{_GOAL_SEP}{goal.description}{_GOAL_SEP}" for goal in goals)
+        # cache_control marks the stable prefix so Anthropic reuses its KV
+        # cache across iterations instead of re-billing these input tokens
+        system_block = {"type": "text", "text": goal_instructions, "cache_control": {"type": "ephemeral"}}
+        return [{"role": "system", "content": [system_block]}]
 
     def format_memory(self, memory: Memory) -> List:
         """Format memory items into message format"""
-        items = memory.get_memories()
-        mapped_items = []
-
-        for item in items:
-            content = item.get("content") or json.dumps(item, indent=4)
-
-            if item.get("type") == "assistant":
-                mapped_items.append({"role": "assistant", "content": content})
-            elif item.get("type") == "environment":
-                mapped_items.append({"role": "user", "content": content})
-            else:
-                mapped_items.append({"role": "user", "content": content})
-
-        return mapped_items
+        # Memory maintains the mapped view incrementally on add_memory
+        return memory.get_messages()
 
     def format_actions(self, actions: List[Action]) -> List:
         """Format actions into tool definitions"""
-        return [
+        tools = [
             {
                 "type": "function",
                 "function": {
                     "name": action.name,
-                    "description": action.description[:1024],
+                    "description": action.description,
                     "parameters": action.parameters,
                 },
             }
             for action in actions
         ]
+        # Marking the last tool caches the whole tool block server-side
+        if tools:
+            tools[-1]["cache_control"] = {"type": "ephemeral"}
+        return tools
 
     def construct_prompt(self, actions: List[Action], environment: Environment, goals: List[Goal], memory: Memory) -> Prompt:
         """Construct complete prompt with goals, memory, and available tools"""
@@ -143,8 +173,8 @@ class AgentFunctionCallingActionLanguage(AgentLanguage):
     def parse_response(self, response: str) -> dict:
         """Parse agent response into structured format"""
         try:
-            return json.loads(response)
-        except Exception:
+            return json_loads(response)
+        except JSONDecodeError:
             return {"tool": "terminate", "args": {"message": response}}
 
 
@@ -155,23 +185,27 @@ class PythonActionRegistry(ActionRegistry):
         super().__init__()
         self.terminate_tool = None
 
+        # Frozensets make the per-tool filters O(1) membership checks instead
+        # of nested list scans
+        tag_set = frozenset(tags) if tags else None
+        tool_name_set = frozenset(tool_names) if tool_names else None
+
         for tool_name, tool_desc in tools.items():
             if tool_name == "terminate":
                 self.terminate_tool = tool_desc
                 continue
 
-            if tool_names and tool_name not in tool_names:
+            if tool_name_set and tool_name not in tool_name_set:
                 continue
 
-            tool_tags = tool_desc.get("tags", [])
-            if tags and not any(tag in tool_tags for tag in tags):
+            if tag_set and tag_set.isdisjoint(tool_desc.get("tags", [])):
                 continue
 
             self.register(
                 Action(
                     name=tool_name,
                     function=tool_desc["function"],
-                    description=tool_desc["description"],
+                    description=tool_desc.get("description_ai", tool_desc["description"]),
                     parameters=tool_desc.get("parameters", {}),
                     terminal=tool_desc.get("terminal", False),
                 )
@@ -184,7 +218,7 @@ class PythonActionRegistry(ActionRegistry):
                 Action(
                     name="terminate",
                     function=self.terminate_tool["function"],
-                    description=self.terminate_tool["description"],
+                    description=self.terminate_tool.get("description_ai", self.terminate_tool["description"]),
                     parameters=self.terminate_tool.get("parameters", {}),
                     terminal=self.terminate_tool.get("terminal", False),
                 )
@@ -201,7 +235,7 @@ class Agent:
         goals: List[Goal],
         agent_language: AgentLanguage,
         action_registry: ActionRegistry,
-        generate_response: Callable[[Prompt], str],
+        generate_response: Callable[[Prompt], Awaitable[str]],
         environment: Environment,
     ):
         self.goals = goals
@@ -210,12 +244,33 @@ class Agent:
         self.actions = action_registry
         self.environment = environment
 
+        # Goals and the action registry do not change during a run, so their
+        # formatted forms are computed once instead of on every iteration
+        self._goal_messages = agent_language.format_goals(goals)
+        self._tool_defs = agent_language.format_actions(action_registry.get_actions())
+        self._tool_defs_version = action_registry._version
+
     def construct_prompt(self, goals: List[Goal], memory: Memory, actions: ActionRegistry) -> Prompt:
         """Build prompt with current context"""
         return self.agent_language.construct_prompt(
             actions=actions.get_actions(), environment=self.environment, goals=goals, memory=memory
         )
 
+    def _get_tool_defs(self) -> List[Dict]:
+        """Get tool definitions, rebuilding only when the registry changed.
+
+        Returning the same list object on cache hits also lets any identity-
+        based memoization downstream (e.g. in the request builder) hit.
+        """
+        if self.actions._version != self._tool_defs_version:
+            self._tool_defs = self.agent_language.format_actions(self.actions.get_actions())
+            self._tool_defs_version = self.actions._version
+        return self._tool_defs
+
+    def construct_prompt_fast(self, memory: Memory) -> Prompt:
+        """Build prompt from precomputed goal/tool blocks plus current memory"""
+        return Prompt(messages=self._goal_messages + self.agent_language.format_memory(memory), tools=self._get_tool_defs())
+
     def get_action(self, response: str):
         """Parse response and get corresponding action"""
         invocation = self.agent_language.parse_response(response)
@@ -224,6 +279,8 @@ class Agent:
 
     def should_terminate(self, response: str) -> bool:
         """Check if agent should terminate based on response"""
+        # Thin wrapper kept for compatibility; run() checks the already-parsed
+        # action directly to avoid parsing the response twice
         action_def, _ = self.get_action(response)
         return action_def and action_def.terminal
 
@@ -233,15 +290,15 @@ class Agent:
 
     def update_memory(self, memory: Memory, response: str, result: dict):
         """Update memory with agent decision and environment response"""
-        new_memories = [{"type": "assistant", "content": response}, {"type": "environment", "content": json.dumps(result)}]
+        new_memories = [{"type": "assistant", "content": response}, {"type": "environment", "content": json_dumps(result)}]
         for m in new_memories:
             memory.add_memory(m)
 
-    def prompt_llm_for_action(self, full_prompt: Prompt) -> str:
+    async def prompt_llm_for_action(self, full_prompt: Prompt) -> str:
         """Get response from language model"""
-        return self.generate_response(full_prompt)
+        return await self.generate_response(full_prompt)
 
-    def run(self, user_input: str, memory=None, max_iterations: int = 50) -> Memory:
+    async def run(self, user_input: str, memory=None, max_iterations: int = 50) -> Memory:
         """
         Execute the agent's main loop.
 
@@ -260,11 +317,11 @@ class Agent:
             print(f"--- Iteration {iteration + 1} ---")
 
             # Construct prompt with current context
-            prompt = self.construct_prompt(self.goals, memory, self.actions)
+            prompt = self.construct_prompt_fast(memory)
 
             print("Agent thinking...")
             # Get agent's decision
-            response = self.prompt_llm_for_action(prompt)
+            response = await self.prompt_llm_for_action(prompt)
             print(f"Agent Decision: {response}")
 
             # Parse and execute action
@@ -280,9 +337,32 @@ class Agent:
             # Update memory
             self.update_memory(memory, response, result)
 
-            # Check for termination
-            if self.should_terminate(response):
+            # Check for termination using the action parsed above
+            if action.terminal:
                 print("Agent terminated.")
                 break
 
         return memory
+
+    async def run_many(self, tasks: List[str], max_iterations: int = 50) -> List:
+        """
+        Run multiple independent tasks concurrently.
+
+        Each task gets its own Memory and runs under a semaphore sized by
+        Config.MAX_CONCURRENCY to respect provider rate limits, so wall time
+        approaches the latency of the slowest task rather than their sum.
+
+        Args:
+            tasks: List of tasks or questions for the agent
+            max_iterations: Maximum number of iterations per task
+
+        Returns:
+            List of Memory objects (or exceptions), one per task, in task order
+        """
+        sem = asyncio.Semaphore(Config.MAX_CONCURRENCY)
+
+        async def _one(task: str):
+            async with sem:
+                return await self.run(task, max_iterations=max_iterations)
+
+        return await asyncio.gather(*[_one(task) for task in tasks], return_exceptions=True)
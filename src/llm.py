@@ -1,15 +1,143 @@
 # LLM integration and response generation functions
+import asyncio
+import hashlib
 import json
+import math
+from collections import OrderedDict
+from typing import List, Optional
 
-from litellm import completion
+from litellm import acompletion
 
-from .config import MODEL_NAME
+from .config import MODEL_NAME, Config
 from .models import Prompt
+from .serialization import json_dumps, json_loads
 
+# Exact-match response cache: blake2b key -> response string, LRU-evicted
+_CACHE_MAX_ENTRIES = 1024
+_exact_cache: "OrderedDict[str, str]" = OrderedDict()
 
-def generate_response(prompt: Prompt) -> str:
+# Semantic response cache: (embedding, response) pairs for the last user
+# message. Lookups scan the whole list, so the cap also bounds lookup cost
+_SEMANTIC_SIMILARITY_THRESHOLD = 0.97
+_SEMANTIC_CACHE_MAX_ENTRIES = 256
+_semantic_cache: List[tuple] = []
+_embedder = None
+
+
+def _cache_key(messages: List[dict], tools: List[dict]) -> str:
+    """Build a stable cache key from the model, messages, and tools."""
+    payload = json.dumps((MODEL_NAME, messages, tools), sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode()).hexdigest()
+
+
+def _exact_cache_get(key: str) -> Optional[str]:
+    """Look up a cached response and refresh its LRU position."""
+    response = _exact_cache.get(key)
+    if response is not None:
+        _exact_cache.move_to_end(key)
+    return response
+
+
+def _exact_cache_put(key: str, response: str):
+    """Store a response, evicting the least recently used entry when full."""
+    _exact_cache[key] = response
+    if len(_exact_cache) > _CACHE_MAX_ENTRIES:
+        _exact_cache.popitem(last=False)
+
+
+def _get_embedder():
+    """Lazily load a local sentence embedder; returns None when unavailable."""
+    global _embedder
+    if _embedder is None:
+        try:
+            from sentence_transformers import SentenceTransformer
+
+            _embedder = SentenceTransformer("all-MiniLM-L6-v2")
+        except ImportError:
+            _embedder = False
+    return _embedder or None
+
+
+def _last_user_message(messages: List[dict]) -> Optional[str]:
+    """Get the content of the most recent user message, if any."""
+    for message in reversed(messages):
+        if message.get("role") == "user" and isinstance(message.get("content"), str):
+            return message["content"]
+    return None
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    """Cosine similarity between two embedding vectors."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(y * y for y in b))
+    if not norm_a or not norm_b:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+def _semantic_cache_get(text: str) -> Optional[str]:
+    """Return a cached response whose query embedding is close enough to text."""
+    embedder = _get_embedder()
+    if embedder is None:
+        return None
+
+    embedding = list(embedder.encode(text))
+    best_score, best_response = 0.0, None
+    for cached_embedding, cached_response in _semantic_cache:
+        score = _cosine_similarity(embedding, cached_embedding)
+        if score > best_score:
+            best_score, best_response = score, cached_response
+
+    if best_score > _SEMANTIC_SIMILARITY_THRESHOLD:
+        return best_response
+    return None
+
+
+def _semantic_cache_put(text: str, response: str):
+    """Store a response keyed by the embedding of the user message.
+
+    The oldest entry is dropped once the cache is full, mirroring the
+    size bound on the exact-match tier.
+    """
+    embedder = _get_embedder()
+    if embedder is not None:
+        _semantic_cache.append((list(embedder.encode(text)), response))
+        if len(_semantic_cache) > _SEMANTIC_CACHE_MAX_ENTRIES:
+            del _semantic_cache[0]
+
+
+def clear_response_cache():
+    """Clear both response cache tiers (mainly for tests)."""
+    _exact_cache.clear()
+    _semantic_cache.clear()
+
+
+async def _completion(messages: List[dict], tools: List[dict]) -> str:
+    """Issue the LLM call and normalize the response to a string."""
+    # limits the response length from the LLM to MAX_TOKENS tokens
+    response = await acompletion(
+        model=MODEL_NAME, messages=messages, max_tokens=Config.MAX_TOKENS, **({"tools": tools} if tools else {})
+    )
+
+    # Bind the message once; each attribute access walks a pydantic model
+    message = response.choices[0].message
+    tool_calls = message.tool_calls if tools else None
+    if tool_calls:
+        tool = tool_calls[0]
+        return json_dumps({"tool": tool.function.name, "args": json_loads(tool.function.arguments)})
+    return message.content
+
+
+async def generate_response(prompt: Prompt) -> str:
     """
     Generate a response from LLM using the provided prompt.
+
+    The call is asynchronous so multiple agents or tasks can await the LLM
+    concurrently on one event loop instead of blocking per request. When
+    Config.ENABLE_PROMPT_CACHE is set, byte-identical prompts are served from
+    an exact-match LRU cache; Config.ENABLE_SEMANTIC_CACHE adds a second tier
+    keyed on an embedding of the last user message.
     Args:
         prompt: Prompt object containing messages and tools
     Returns:
@@ -18,19 +146,72 @@ def generate_response(prompt: Prompt) -> str:
     messages = prompt.messages
     tools = prompt.tools
 
-    if not tools:
-        response = completion(model=MODEL_NAME, messages=messages, max_tokens=1024)
-        return response.choices[0].message.content
-    else:
-        # limits the response length from the LLM to 1024 tokens
-        response = completion(model=MODEL_NAME, messages=messages, tools=tools, max_tokens=1024)
-
-        if response.choices[0].message.tool_calls:
-            tool = response.choices[0].message.tool_calls[0]
-            result = {
-                "tool": tool.function.name,
-                "args": json.loads(tool.function.arguments),
-            }
-            return json.dumps(result)
-        else:
-            return response.choices[0].message.content
+    use_exact_cache = Config.ENABLE_PROMPT_CACHE
+    use_semantic_cache = Config.ENABLE_SEMANTIC_CACHE
+    key = _cache_key(messages, tools) if use_exact_cache else None
+    user_message = _last_user_message(messages) if use_semantic_cache else None
+
+    if use_exact_cache:
+        cached = _exact_cache_get(key)
+        if cached is not None:
+            return cached
+
+    if user_message is not None:
+        cached = _semantic_cache_get(user_message)
+        if cached is not None:
+            return cached
+
+    response = await _completion(messages, tools)
+
+    if use_exact_cache:
+        _exact_cache_put(key, response)
+    if user_message is not None:
+        _semantic_cache_put(user_message, response)
+
+    return response
+
+
+async def generate_response_stream(prompt: Prompt):
+    """
+    Stream a response from the LLM, yielding text chunks as they arrive.
+
+    Text content is yielded per delta, so callers see output at time-to-first-
+    token instead of after full generation. Tool-call deltas are accumulated
+    incrementally (name first, then argument fragments) and the invocation is
+    yielded once as a single JSON string, matching generate_response's format.
+    Args:
+        prompt: Prompt object containing messages and tools
+    Yields:
+        str: Response chunks, or one JSON string for a tool call
+    """
+    messages = prompt.messages
+    tools = prompt.tools
+
+    kwargs = {"model": MODEL_NAME, "messages": messages, "max_tokens": Config.MAX_TOKENS, "stream": True}
+    if tools:
+        kwargs["tools"] = tools
+
+    tool_name = None
+    tool_args_parts = []
+
+    stream = await acompletion(**kwargs)
+    async for chunk in stream:
+        delta = chunk.choices[0].delta
+        tool_calls = getattr(delta, "tool_calls", None)
+        if tool_calls:
+            call = tool_calls[0]
+            if call.function.name:
+                tool_name = call.function.name
+            if call.function.arguments:
+                tool_args_parts.append(call.function.arguments)
+        elif delta.content:
+            yield delta.content
+
+    if tool_name is not None:
+        args = json_loads("".join(tool_args_parts)) if tool_args_parts else {}
+        yield json_dumps({"tool": tool_name, "args": args})
+
+
+def generate_response_sync(prompt: Prompt) -> str:
+    """Synchronous wrapper around generate_response for callers without an event loop."""
+    return asyncio.run(generate_response(prompt))
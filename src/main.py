@@ -4,6 +4,7 @@ AI Agent Framework with Claude Integration
 A tool decorator system for building AI agents with Claude.
 """
 
+import asyncio
 import os
 
 from dotenv import load_dotenv
@@ -48,7 +49,7 @@ def main():
 
     # Run agent
     print("Starting AI Agent with Claude...")
-    memory = agent.run("Help me add 5 + 3 and then tell me about Python programming")
+    memory = asyncio.run(agent.run("Help me add 5 + 3 and then tell me about Python programming"))
 
     print("\n--- Final Memory ---")
     for i, item in enumerate(memory.get_memories()):
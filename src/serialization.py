@@ -0,0 +1,27 @@
+# Fast JSON helpers with an orjson fast path and a stdlib fallback
+
+try:
+    import orjson
+
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def json_dumps(obj) -> str:
+        """Serialize obj to a compact JSON string."""
+        return orjson.dumps(obj).decode()
+
+    def json_loads(data):
+        """Deserialize a JSON string or bytes."""
+        return orjson.loads(data)
+
+except ImportError:
+    import json
+
+    JSONDecodeError = json.JSONDecodeError
+
+    def json_dumps(obj) -> str:
+        """Serialize obj to a compact JSON string."""
+        return json.dumps(obj, separators=(",", ":"))
+
+    def json_loads(data):
+        """Deserialize a JSON string or bytes."""
+        return json.loads(data)
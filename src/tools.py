@@ -1,10 +1,69 @@
 # Tool decorators, registration, and metadata extraction
 import inspect
 import os
+from collections import defaultdict
 from typing import List, get_type_hints
 
+from .serialization import json_dumps
+
 tools = {}
-tools_by_tag = {}
+tools_by_tag = defaultdict(list)
+
+# Bumped on every registration so version-keyed caches of the registry's
+# contents know when to rebuild
+_tools_version = 0
+
+# Metadata is deterministic per (function, decorator args), so repeated
+# registrations (e.g. test runners re-importing tool modules) reuse the
+# computed schema instead of re-running signature introspection
+_metadata_cache = {}
+
+# Python type -> JSON schema type, shared by every registration instead of
+# being rebuilt per parameter inside get_tool_metadata
+_JSON_TYPE_MAP = {str: "string", int: "integer", float: "number", bool: "boolean", list: "array", dict: "object"}
+
+
+# Last to_ai_tools conversion as (input list, registry version, result).
+# The strong reference to the input list keeps its identity stable, so the
+# `is` check below cannot collide with a recycled id(); agent loops serialize
+# the same metadata every LLM call, so the steady state is a cache hit
+_ai_tools_cache = None
+
+# AI-format payload for the whole registry, appended to in register_tool so
+# the hot LLM-prep path returns a prebuilt list instead of running a
+# comprehension over the registry
+_ai_tools = []
+
+
+def get_ai_tools() -> List[dict]:
+    """
+    Return the AI-format tool list for every registered tool.
+
+    The list is maintained incrementally at registration time; treat it as
+    read-only.
+    """
+    return _ai_tools
+
+
+def to_ai_tools_json(tool_names=None) -> str:
+    """
+    Assemble the AI-format tools payload as a JSON string.
+
+    Parameter schemas are serialized once at registration and spliced in
+    here, so no schema is json-encoded more than once per process.
+
+    Args:
+        tool_names: Optional iterable restricting which tools to include
+    Returns:
+        str: JSON array of AI-format tool definitions
+    """
+    names = tool_names if tool_names is not None else tools.keys()
+    parts = [
+        '{"type":"function","function":{"name":%s,"description":%s,"parameters":%s}}'
+        % (json_dumps(name), json_dumps(tools[name]["description_ai"]), tools[name]["parameters_json"])
+        for name in names
+    ]
+    return "[" + ",".join(parts) + "]"
 
 
 def to_ai_tools(tools_metadata: List[dict]):
@@ -16,18 +75,25 @@ def to_ai_tools(tools_metadata: List[dict]):
     Returns:
         List of tools formatted for AI consumption
     """
+    global _ai_tools_cache
+
+    if _ai_tools_cache is not None:
+        cached_input, cached_version, cached_result = _ai_tools_cache
+        if cached_input is tools_metadata and cached_version == _tools_version:
+            return cached_result
 
     ai_tools = [
         {
             "type": "function",
             "function": {
                 "name": t["tool_name"],
-                "description": t.get("description", ""),
+                "description": t.get("description_ai") or t.get("description", ""),
                 "parameters": t.get("parameters", {}),
             },
         }
         for t in tools_metadata
     ]
+    _ai_tools_cache = (tools_metadata, _tools_version, ai_tools)
     return ai_tools
 
 
@@ -48,30 +114,52 @@ def get_tool_metadata(func, tool_name=None, description=None, parameters_overrid
     tool_name = tool_name or func.__name__
     description = description or (func.__doc__.strip() if func.__doc__ else "No description provided.")
 
-    if parameters_override is None:
-        signature = inspect.signature(func)
-        type_hints = get_type_hints(func)
+    cache_key = (id(func), tool_name, description, terminal, tuple(tags or ()), id(parameters_override))
+    cached = _metadata_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
+    if parameters_override is None:
         args_schema = {"type": "object", "properties": {}, "required": []}
+        code = getattr(func, "__code__", None)
+
+        if (
+            code is not None
+            and func.__defaults__ is None
+            and getattr(func, "__kwdefaults__", None) is None
+            and code.co_kwonlyargcount == 0
+            and not code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+        ):
+            # Fast path: positional parameters only, no defaults, no
+            # keyword-only parameters, no *args/**kwargs.
+            # Reads co_varnames and __annotations__ directly, skipping the
+            # Signature objects and typing._eval_type work of the slow path;
+            # every parameter is required
+            annotations = func.__annotations__
+            for param_name in code.co_varnames[: code.co_argcount]:
+                if param_name in ["action_context", "action_agent"]:
+                    continue
+
+                param_type = annotations.get(param_name, str)
+                args_schema["properties"][param_name] = {"type": _JSON_TYPE_MAP.get(param_type, "string")}
+                args_schema["required"].append(param_name)
+        else:
+            signature = inspect.signature(func)
+            type_hints = get_type_hints(func)
 
-        for param_name, param in signature.parameters.items():
-            if param_name in ["action_context", "action_agent"]:
-                continue
-
-            def get_json_type(param_type):
-                type_mapping = {str: "string", int: "integer", float: "number", bool: "boolean", list: "array", dict: "object"}
-                return type_mapping.get(param_type, "string")
+            for param_name, param in signature.parameters.items():
+                if param_name in ["action_context", "action_agent"]:
+                    continue
 
-            param_type = type_hints.get(param_name, str)
-            param_schema = {"type": get_json_type(param_type)}
-            args_schema["properties"][param_name] = param_schema
+                param_type = type_hints.get(param_name, str)
+                args_schema["properties"][param_name] = {"type": _JSON_TYPE_MAP.get(param_type, "string")}
 
-            if param.default == inspect.Parameter.empty:
-                args_schema["required"].append(param_name)
+                if param.default == inspect.Parameter.empty:
+                    args_schema["required"].append(param_name)
     else:
         args_schema = parameters_override
 
-    return {
+    metadata = {
         "tool_name": tool_name,
         "description": description,
         "parameters": args_schema,
@@ -79,6 +167,8 @@ def get_tool_metadata(func, tool_name=None, description=None, parameters_overrid
         "terminal": terminal,
         "tags": tags or [],
     }
+    _metadata_cache[cache_key] = metadata
+    return metadata
 
 
 def register_tool(tool_name=None, description=None, parameters_override=None, terminal=False, tags=None):
@@ -96,6 +186,8 @@ def register_tool(tool_name=None, description=None, parameters_override=None, te
     """
 
     def decorator(func):
+        global _tools_version
+
         metadata = get_tool_metadata(
             func=func,
             tool_name=tool_name,
@@ -105,19 +197,42 @@ def register_tool(tool_name=None, description=None, parameters_override=None, te
             tags=tags,
         )
 
+        if metadata["tool_name"] in tools:
+            # Already registered (e.g. fixtures re-imported by a test runner);
+            # keep the existing entry and skip duplicate tag bookkeeping
+            return func
+
+        # Descriptions are immutable once registered, so the truncated form
+        # and the length are computed here rather than on every serialization
+        desc = metadata["description"]
         tools[metadata["tool_name"]] = {
-            "description": metadata["description"],
+            "description": desc,
+            "description_ai": desc[:1024],
+            "description_length": len(desc),
+            "description_too_long": len(desc) > 1024,
             "parameters": metadata["parameters"],
+            "parameters_json": json_dumps(metadata["parameters"]),
             "function": metadata["function"],
             "terminal": metadata["terminal"],
             "tags": metadata["tags"] or [],
         }
 
         for tag in metadata["tags"]:
-            if tag not in tools_by_tag:
-                tools_by_tag[tag] = []
             tools_by_tag[tag].append(metadata["tool_name"])
 
+        _ai_tools.append(
+            {
+                "type": "function",
+                "function": {
+                    "name": metadata["tool_name"],
+                    "description": desc[:1024],
+                    "parameters": metadata["parameters"],
+                },
+            }
+        )
+
+        _tools_version += 1
+
         return func
 
     return decorator
@@ -10,17 +10,13 @@ This package contains comprehensive tests for all components of the agent framew
 - test_integration.py: End-to-end system integration tests
 
 Usage:
-    # Run all tests
-    python -m unittest discover tests/ -v
+    # Run all tests (pytest collects both unittest classes and plain functions)
+    python -m pytest tests/
 
     # Run specific test module
-    python -m unittest tests.test_tools -v
+    python -m pytest tests/test_tools.py
 """
 
-import litellm
-
-litellm._turn_on_debug()
-
 import sys
 from pathlib import Path
 
@@ -35,58 +31,165 @@ sys.path.insert(0, str(project_root))
 test_env_path = project_root / ".env.test"
 load_dotenv(test_env_path)
 
+import functools
+import json
 import unittest
-from unittest.mock import MagicMock, patch
+from dataclasses import dataclass, field
+from typing import List
 
 # Import from src package
 from src.config import MODEL_NAME, Config, get_test_config
 
+# Materialize the env-backed test settings once at session start; ConfigMeta
+# caches each on first access, so every later read inside a test is a plain
+# class-attribute lookup instead of an os.environ probe
+for _setting in ("MOCK_LLM_CALLS", "TEST_TIMEOUT", "VERBOSE_TESTS"):
+    getattr(Config, _setting)
+del _setting
+
+# litellm's debug mode installs synchronous logging handlers that slow every
+# call by an order of magnitude, so it is opt-in rather than always-on
+if Config.VERBOSE_TESTS:
+    import litellm
+
+    litellm._turn_on_debug()
+
+# Plain dataclasses mirror the litellm response shape without MagicMock's
+# per-attribute __getattr__ overhead and lazy child-mock construction.
+# frozen only, no slots=True: dataclass slots need Python 3.10 and the repo
+# still supports 3.9
+
+
+@dataclass(frozen=True)
+class MockMessage:
+    """Mock of a litellm response message."""
+
+    content: str = "Test response"
+    tool_calls: tuple = ()
+
+
+@dataclass(frozen=True)
+class MockChoice:
+    """Mock of a litellm response choice."""
+
+    message: MockMessage = field(default_factory=MockMessage)
+
 
 class MockLLMResponse:
     """Mock response object that mimics the structure of litellm responses."""
 
+    __slots__ = ("choices",)
+
     def __init__(self, content="Test response", tool_calls=None):
-        self.choices = [MagicMock()]
-        self.choices[0].message = MagicMock()
-        self.choices[0].message.content = content
-        self.choices[0].message.tool_calls = tool_calls or []
+        self.choices: List[MockChoice] = [MockChoice(MockMessage(content, tuple(tool_calls or ())))]
+
+
+@dataclass(frozen=True)
+class MockToolFunction:
+    """Mock of a litellm tool-call function payload."""
+
+    name: str
+    arguments: str
+
+
+@dataclass(frozen=True)
+class MockToolCall:
+    """Mock of a litellm tool call."""
+
+    function: MockToolFunction
+    id: str = "mock_call_id"
+
+
+# Canonical serializer for cache keys, bound once at module level so the
+# hot mock-construction path skips repeated keyword-argument setup
+_SORT_DUMPS = functools.partial(json.dumps, sort_keys=True, separators=(",", ":"))
+
+# Tests build the same responses and tool calls repeatedly; since the mocks
+# are read-only, identical requests can share one cached instance
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_llm_response(content, tool_calls):
+    return MockLLMResponse(content, tool_calls)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_tool_call(function_name, arguments_json, call_id):
+    return MockToolCall(function=MockToolFunction(name=function_name, arguments=arguments_json), id=call_id)
 
 
 def create_mock_llm_response(content="Mock LLM response", tool_calls=None):
     """Create a mock LLM response with the expected structure."""
-    return MockLLMResponse(content, tool_calls)
+    return _cached_llm_response(content, tuple(tool_calls) if tool_calls else ())
 
 
 def create_mock_tool_call(function_name, arguments_dict, call_id="mock_call_id"):
     """Create a mock tool call object."""
-    mock_tool_call = MagicMock()
-    mock_tool_call.function.name = function_name
-    mock_tool_call.function.arguments = str(arguments_dict).replace("'", '"')  # JSON format
-    mock_tool_call.id = call_id
-    return mock_tool_call
+    return _cached_tool_call(function_name, _SORT_DUMPS(arguments_dict), call_id)
+
+
+class FakeAcompletion:
+    """Async stand-in for litellm.acompletion, swapped in once per session.
+
+    A plain callable with no unittest.mock patch machinery or MagicMock
+    bookkeeping; it supports only the surface the tests actually use
+    (return_value, side_effect, call counting, assert_called_once).
+    """
+
+    def __init__(self):
+        self.reset()
+
+    async def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        self.call_args = (args, kwargs)
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+    def reset(self):
+        """Reset call state and restore the default response."""
+        self.call_count = 0
+        self.call_args = None
+        self.side_effect = None
+        self.return_value = create_mock_llm_response()
+
+    def assert_called_once(self):
+        """Assert the fake was called exactly once."""
+        if self.call_count != 1:
+            raise AssertionError(f"Expected acompletion to be called once. Called {self.call_count} times.")
+
+
+# Swap the fake into src.llm once at import time; every test in the session
+# then shares it with zero per-test patching cost
+fake_acompletion = FakeAcompletion()
+if Config.MOCK_LLM_CALLS:
+    import src.llm
+
+    src.llm.acompletion = fake_acompletion
+
+# Register the shared test tools so unittest-based runs (README, CI scripts)
+# see them; under pytest the conftest session fixture does the same import
+from tests import _tool_fixtures  # noqa: E402,F401
 
 
 class BaseTestCase(unittest.TestCase):
+    """Base test case for tests that never touch the LLM; no mocking cost."""
+
+
+class LLMMockedTestCase(BaseTestCase):
     """Base test case that automatically handles LLM mocking."""
 
+    mock_completion = fake_acompletion if Config.MOCK_LLM_CALLS else None
+
     def setUp(self):
-        """Set up test with automatic LLM mocking if configured."""
+        """Reset the shared fake between tests instead of re-patching."""
         super().setUp()
-        if Config.MOCK_LLM_CALLS:
-            # Start LLM mocking for this test
-            self.llm_patcher = patch("src.llm.completion")
-            self.mock_completion = self.llm_patcher.start()
-            self.mock_completion.return_value = create_mock_llm_response()
-
-    def tearDown(self):
-        """Clean up test mocking."""
-        if hasattr(self, "llm_patcher"):
-            self.llm_patcher.stop()
-        super().tearDown()
+        if self.mock_completion is not None:
+            self.mock_completion.reset()
 
     def set_mock_llm_response(self, content="Mock response", tool_calls=None):
         """Convenience method to set the mock LLM response."""
-        if hasattr(self, "mock_completion"):
+        if self.mock_completion is not None:
             self.mock_completion.return_value = create_mock_llm_response(content, tool_calls)
 
 
@@ -98,4 +201,11 @@ if Config.VERBOSE_TESTS:
     print(f"  MODEL_NAME: {MODEL_NAME}")
 
 # Export commonly used items for easy import
-__all__ = ["BaseTestCase", "create_mock_llm_response", "create_mock_tool_call", "get_test_config", "MockLLMResponse"]
+__all__ = [
+    "BaseTestCase",
+    "LLMMockedTestCase",
+    "create_mock_llm_response",
+    "create_mock_tool_call",
+    "get_test_config",
+    "MockLLMResponse",
+]
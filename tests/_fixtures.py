@@ -0,0 +1,12 @@
+"""
+Shared immutable test fixtures.
+
+Goal is a frozen dataclass, so tests that need an identical goal can share a
+single module-level instance instead of re-running dataclass __init__ in every
+setUp.
+"""
+
+from src.models import Goal
+
+DEFAULT_GOAL = Goal(priority=1, name="Test Agent System", description="Test the agent system functionality")
+ERROR_GOAL = Goal(priority=1, name="Test Error Handling", description="Test error handling functionality")
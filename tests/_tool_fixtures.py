@@ -0,0 +1,29 @@
+"""
+Shared test tools, registered once per session via conftest.py.
+
+Keeping the registrations here (instead of inside test methods) means
+register_tool runs once per process rather than once per test run, and the
+global registry state is deterministic for every worker. tool_name is set
+explicitly so the function names stay out of pytest's test collection
+namespace.
+"""
+
+from src.tools import register_tool
+
+
+@register_tool(tool_name="test_add", description="A test tool for adding numbers")
+def _add_tool(a: int, b: int) -> int:
+    """Add two numbers together."""
+    return a + b
+
+
+@register_tool(tool_name="test_multiply", description="Another test tool")
+def _multiply_tool(x: int, y: int) -> int:
+    """Multiply two numbers."""
+    return x * y
+
+
+@register_tool(tool_name="error_prone_tool", description="Test tool for error handling")
+def _error_prone_tool(required_param: str) -> str:
+    """A tool that requires a parameter."""
+    return f"Processed: {required_param}"
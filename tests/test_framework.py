@@ -2,14 +2,12 @@
 Tests for framework module - agent functionality, memory, actions, etc.
 """
 
-import os
-import sys
+import asyncio
 import unittest
 
-# Add parent directory to path to import project modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from src.framework import Action, ActionRegistry, Agent, Environment, Memory
+# The project root is placed on sys.path once per session by conftest.py
+from src.config import Config
+from src.framework import Action, ActionRegistry, Agent, AgentFunctionCallingActionLanguage, Environment, Memory
 from src.models import Goal
 
 
@@ -139,7 +137,98 @@ class TestEnvironment(unittest.TestCase):
 
         self.assertFalse(result["tool_executed"])
         self.assertIn("error", result)
-        self.assertIn("traceback", result)
+        self.assertIn("TypeError", result["error"])
+        # Tracebacks are only included when VERBOSE_ERRORS is enabled
+        self.assertNotIn("traceback", result)
+
+
+class TestAgentRunMany(unittest.TestCase):
+    """Test Agent.run_many's ordering and exception contract."""
+
+    def setUp(self):
+        """Build a minimal agent; each test stubs run() with its own coroutine."""
+
+        async def fake_generate_response(prompt):
+            return "response"
+
+        self.agent = Agent(
+            goals=[Goal(1, "Test Goal", "A test goal")],
+            agent_language=AgentFunctionCallingActionLanguage(),
+            action_registry=ActionRegistry(),
+            generate_response=fake_generate_response,
+            environment=Environment(),
+        )
+
+    def test_run_many_empty_task_list(self):
+        """Test that an empty task list returns an empty result list."""
+        results = asyncio.run(self.agent.run_many([]))
+        self.assertEqual(results, [])
+
+    def test_run_many_preserves_task_order(self):
+        """Test that results come back in task order even when tasks finish out of order."""
+
+        async def fake_run(task, memory=None, max_iterations=50):
+            # Earlier tasks sleep longer, so completion order is reversed
+            await asyncio.sleep(0.01 * (3 - int(task)))
+            return f"done:{task}"
+
+        self.agent.run = fake_run
+
+        results = asyncio.run(self.agent.run_many(["0", "1", "2"]))
+
+        self.assertEqual(results, ["done:0", "done:1", "done:2"])
+
+    def test_run_many_returns_exceptions_in_place(self):
+        """Test that a failing task yields its exception in-slot without aborting the rest."""
+
+        async def fake_run(task, memory=None, max_iterations=50):
+            if task == "boom":
+                raise ValueError("task failed")
+            return f"done:{task}"
+
+        self.agent.run = fake_run
+
+        results = asyncio.run(self.agent.run_many(["ok", "boom", "also ok"]))
+
+        self.assertEqual(results[0], "done:ok")
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(str(results[1]), "task failed")
+        self.assertEqual(results[2], "done:also ok")
+
+    def test_run_many_passes_max_iterations(self):
+        """Test that the per-task iteration cap is forwarded to each run."""
+        seen = []
+
+        async def fake_run(task, memory=None, max_iterations=50):
+            seen.append(max_iterations)
+            return task
+
+        self.agent.run = fake_run
+
+        asyncio.run(self.agent.run_many(["a", "b"], max_iterations=7))
+
+        self.assertEqual(seen, [7, 7])
+
+    def test_run_many_respects_concurrency_limit(self):
+        """Test that no more than Config.MAX_CONCURRENCY tasks run at once."""
+        original = Config.MAX_CONCURRENCY
+        Config.MAX_CONCURRENCY = 2
+        in_flight = {"now": 0, "peak": 0}
+
+        async def fake_run(task, memory=None, max_iterations=50):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return task
+
+        self.agent.run = fake_run
+        try:
+            asyncio.run(self.agent.run_many(["a", "b", "c", "d", "e"]))
+        finally:
+            Config.MAX_CONCURRENCY = original
+
+        self.assertLessEqual(in_flight["peak"], 2)
 
 
 if __name__ == "__main__":
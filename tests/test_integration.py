@@ -2,40 +2,45 @@
 Integration tests for the complete agent system.
 """
 
-import os
 import unittest
-from unittest.mock import MagicMock
 
-from src.config import Config
-from src.framework import Agent, AgentFunctionCallingActionLanguage, Environment, PythonActionRegistry
-from src.llm import generate_response
-from src.main import main
 from src.models import Goal
-from src.tools import register_tool
 
 # Import from the tests package to get automatic setup
-from tests import BaseTestCase, create_mock_llm_response, create_mock_tool_call
+from tests import LLMMockedTestCase, create_mock_llm_response, create_mock_tool_call
+from tests._fixtures import DEFAULT_GOAL, ERROR_GOAL
 
+# The framework/llm modules are imported inside the tests that use them so
+# collection does not pay for the heavy imports in every xdist worker. The
+# shared test tools (test_add, test_multiply, error_prone_tool) are registered
+# once per session by tests/_tool_fixtures.py via conftest.py.
 
-class TestAgentIntegration(BaseTestCase):
+
+class TestAgentIntegration(LLMMockedTestCase):
     """Test full agent integration and workflow."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        super().setUp()  # Important: calls BaseTestCase.setUp() for mocking
-        self.test_goal = Goal(priority=1, name="Test Agent System", description="Test the agent system functionality")
+    # Goal is frozen, so the shared module-level instance is safe to reuse
+    test_goal = DEFAULT_GOAL
+
+    @classmethod
+    def setUpClass(cls):
+        """Build one shared Agent for the whole class; the tests only inspect
+        it (get_actions, execute_action), they never mutate its state."""
+        super().setUpClass()
+        from src.framework import Agent, AgentFunctionCallingActionLanguage, Environment, PythonActionRegistry
+        from src.llm import generate_response
+
+        cls.action_language = AgentFunctionCallingActionLanguage()
+        cls.action_registry = PythonActionRegistry()
+        cls.environment = Environment()
+        cls.agent = Agent([cls.test_goal], cls.action_language, cls.action_registry, generate_response, cls.environment)
 
     def test_agent_basic_workflow(self):
         """Test basic agent workflow with mocked LLM response."""
         # Set up mock response using inherited method
         self.set_mock_llm_response("Hello! I understand your goal.")
 
-        # Create agent components
-        action_language = AgentFunctionCallingActionLanguage()
-        action_registry = PythonActionRegistry()
-        environment = Environment()
-
-        agent = Agent([self.test_goal], action_language, action_registry, generate_response, environment)
+        agent = self.agent
 
         # Test that agent can be created and has expected attributes
         self.assertIsNotNone(agent.goals)
@@ -45,23 +50,11 @@ class TestAgentIntegration(BaseTestCase):
 
     def test_agent_with_tool_call(self):
         """Test agent workflow with tool calling."""
-
-        # Create a test tool
-        @register_tool(description="A test tool for adding numbers")
-        def test_add(a: int, b: int) -> int:
-            """Add two numbers together."""
-            return a + b
-
         # Create mock tool call response
         tool_call = create_mock_tool_call("test_add", {"a": 5, "b": 3})
         self.set_mock_llm_response("I'll add those numbers for you.", [tool_call])
 
-        # Create agent components
-        action_language = AgentFunctionCallingActionLanguage()
-        action_registry = PythonActionRegistry()
-        environment = Environment()
-
-        agent = Agent([self.test_goal], action_language, action_registry, generate_response, environment)
+        agent = self.agent
 
         # Verify agent has access to registered tools
         available_actions = agent.actions.get_actions()
@@ -70,25 +63,14 @@ class TestAgentIntegration(BaseTestCase):
 
     def test_tool_registration_integration(self):
         """Test that tool registration works properly."""
-
-        @register_tool(description="Another test tool")
-        def test_multiply(x: int, y: int) -> int:
-            """Multiply two numbers."""
-            return x * y
-
-        # Create agent components
-        action_language = AgentFunctionCallingActionLanguage()
-        action_registry = PythonActionRegistry()
-        environment = Environment()
-
-        agent = Agent([self.test_goal], action_language, action_registry, generate_response, environment)
+        agent = self.agent
         actions = agent.actions.get_actions()
         action_names = [action.name for action in actions]
 
         self.assertIn("test_multiply", action_names)
 
 
-class TestSystemConfiguration(BaseTestCase):
+class TestSystemConfiguration(unittest.TestCase):
     """Test system configuration and setup."""
 
     def test_all_modules_importable(self):
@@ -122,28 +104,28 @@ class TestSystemConfiguration(BaseTestCase):
         self.assertTrue(is_dataclass(Goal))
 
 
-class TestErrorHandling(BaseTestCase):
+class TestErrorHandling(LLMMockedTestCase):
     """Test error handling across the system."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        super().setUp()  # Important: calls BaseTestCase.setUp() for mocking
-        self.test_goal = Goal(priority=1, name="Test Error Handling", description="Test error handling functionality")
+    # Goal is frozen, so the shared module-level instance is safe to reuse
+    test_goal = ERROR_GOAL
 
-    def test_invalid_tool_parameters(self):
-        """Test handling of invalid tool parameters."""
+    @classmethod
+    def setUpClass(cls):
+        """Build one shared Agent for the whole class; the tests only inspect
+        it (get_actions, execute_action), they never mutate its state."""
+        super().setUpClass()
+        from src.framework import Agent, AgentFunctionCallingActionLanguage, Environment, PythonActionRegistry
+        from src.llm import generate_response
 
-        @register_tool(description="Test tool for error handling")
-        def error_prone_tool(required_param: str) -> str:
-            """A tool that requires a parameter."""
-            return f"Processed: {required_param}"
+        cls.action_language = AgentFunctionCallingActionLanguage()
+        cls.action_registry = PythonActionRegistry()
+        cls.environment = Environment()
+        cls.agent = Agent([cls.test_goal], cls.action_language, cls.action_registry, generate_response, cls.environment)
 
-        # Create agent components
-        action_language = AgentFunctionCallingActionLanguage()
-        action_registry = PythonActionRegistry()
-        environment = Environment()
-
-        agent = Agent([self.test_goal], action_language, action_registry, generate_response, environment)
+    def test_invalid_tool_parameters(self):
+        """Test handling of invalid tool parameters."""
+        agent = self.agent
         action = agent.actions.get_action("error_prone_tool")
 
         # Execute with missing parameter - should handle gracefully
@@ -2,30 +2,30 @@
 Tests for LLM module - response generation and API integration.
 """
 
+import asyncio
+import json
+import logging
 import os
 import sys
 import unittest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+
+import pytest
 
 from src.models import Prompt
 
 # Import from the tests package to get automatic setup
-from tests import BaseTestCase, Config, create_mock_llm_response, create_mock_tool_call
-
-# Try to import llm module, handle gracefully if missing
-try:
-    from src.llm import generate_response
+from tests import Config, LLMMockedTestCase, create_mock_llm_response, create_mock_tool_call
 
-    LLM_MODULE_AVAILABLE = True
-except ImportError:
-    LLM_MODULE_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
-    # Create a dummy function for testing
-    def generate_response(prompt, tools=None):
-        return "Mock response for testing"
+# Skip the whole module at collection time if the LLM stack is unavailable,
+# instead of guarding every test with its own skipUnless decorator
+llm = pytest.importorskip("src.llm")
+generate_response = llm.generate_response
 
 
-class TestGenerateResponse(BaseTestCase):
+class TestGenerateResponse(LLMMockedTestCase):
     """Test generate_response function with automatic LLM mocking."""
 
     def setUp(self):
@@ -33,11 +33,10 @@ class TestGenerateResponse(BaseTestCase):
         super().setUp()  # Important: call parent setUp for mocking
         self.test_prompt = Prompt(messages=[{"role": "user", "content": "Hello, how are you?"}], tools=[], metadata={})
 
-    @unittest.skipUnless(LLM_MODULE_AVAILABLE, "LLM module not available")
     def test_generate_response_basic(self):
         """Test basic response generation with automatic mocking."""
         # BaseTestCase automatically sets up mocking
-        result = generate_response(self.test_prompt)
+        result = asyncio.run(generate_response(self.test_prompt))
 
         # Verify we got a response
         self.assertIsNotNone(result)
@@ -45,7 +44,6 @@ class TestGenerateResponse(BaseTestCase):
         # Verify the mock was called
         self.mock_completion.assert_called_once()
 
-    @unittest.skipUnless(LLM_MODULE_AVAILABLE, "LLM module not available")
     def test_generate_response_with_tools(self):
         """Test response generation with tool calling using automatic mocking."""
         # Create mock tools
@@ -57,7 +55,7 @@ class TestGenerateResponse(BaseTestCase):
         # Set up the mock response using the inherited method
         self.set_mock_llm_response("I'll help you with that.")
 
-        result = generate_response(test_prompt_with_tools)
+        result = asyncio.run(generate_response(test_prompt_with_tools))
 
         # Verify the completion was called
         self.mock_completion.assert_called_once()
@@ -65,7 +63,6 @@ class TestGenerateResponse(BaseTestCase):
         # Verify we got a result
         self.assertIsNotNone(result)
 
-    @unittest.skipUnless(LLM_MODULE_AVAILABLE, "LLM module not available")
     def test_generate_response_with_tool_calls(self):
         """Test response generation when tool calls are returned."""
         # Create a mock tool call using the utility function
@@ -81,7 +78,7 @@ class TestGenerateResponse(BaseTestCase):
         # Create a prompt with tools
         test_prompt_with_tools = Prompt(messages=[{"role": "user", "content": "Test prompt"}], tools=mock_tools)
 
-        result = generate_response(test_prompt_with_tools)
+        result = asyncio.run(generate_response(test_prompt_with_tools))
 
         # Verify we got a result
         self.assertIsNotNone(result)
@@ -104,14 +101,13 @@ class TestGenerateResponse(BaseTestCase):
         self.assertEqual(len(prompt_with_messages.messages), 2)
         self.assertEqual(len(prompt_with_messages.tools), 1)
 
-    @unittest.skipUnless(LLM_MODULE_AVAILABLE, "LLM module not available")
     def test_custom_mock_response(self):
         """Test setting custom mock responses."""
         # Set a custom mock response
         custom_content = "This is a custom test response"
         self.set_mock_llm_response(custom_content)
 
-        result = generate_response(self.test_prompt)
+        result = asyncio.run(generate_response(self.test_prompt))
 
         # Verify the custom response was used
         self.assertIsNotNone(result)
@@ -120,7 +116,6 @@ class TestGenerateResponse(BaseTestCase):
         mock_response = self.mock_completion.return_value
         self.assertEqual(mock_response.choices[0].message.content, custom_content)
 
-    @unittest.skipUnless(LLM_MODULE_AVAILABLE, "LLM module not available")
     def test_api_error_handling(self):
         """Test handling of API errors."""
         # Check if mock is available
@@ -131,18 +126,229 @@ class TestGenerateResponse(BaseTestCase):
         self.mock_completion.side_effect = Exception("API Error")
 
         with self.assertRaises(Exception):
-            generate_response(self.test_prompt)
+            asyncio.run(generate_response(self.test_prompt))
+
+
+class TestResponseCache(LLMMockedTestCase):
+    """Test the exact and semantic response-cache tiers around generate_response."""
+
+    def setUp(self):
+        """Start each test with empty caches and remember the configured flags."""
+        super().setUp()
+        llm.clear_response_cache()
+        self._orig_prompt_cache = Config.ENABLE_PROMPT_CACHE
+        self._orig_semantic_cache = Config.ENABLE_SEMANTIC_CACHE
+
+    def tearDown(self):
+        """Restore the cache flags and leave the caches empty for other tests."""
+        Config.ENABLE_PROMPT_CACHE = self._orig_prompt_cache
+        Config.ENABLE_SEMANTIC_CACHE = self._orig_semantic_cache
+        llm.clear_response_cache()
+        super().tearDown()
+
+    @staticmethod
+    def _prompt(content):
+        return Prompt(messages=[{"role": "user", "content": content}], tools=[], metadata={})
+
+    def test_caching_disabled_by_default(self):
+        """Test that repeated identical prompts hit the LLM when caching is off."""
+        self.assertFalse(Config.ENABLE_PROMPT_CACHE)
+        self.assertFalse(Config.ENABLE_SEMANTIC_CACHE)
+
+        prompt = self._prompt("Same question")
+        asyncio.run(generate_response(prompt))
+        asyncio.run(generate_response(prompt))
+
+        self.assertEqual(self.mock_completion.call_count, 2)
+
+    def test_exact_cache_hit(self):
+        """Test that a byte-identical prompt is served from the exact cache."""
+        Config.ENABLE_PROMPT_CACHE = True
+
+        prompt = self._prompt("What is 2 + 2?")
+        first = asyncio.run(generate_response(prompt))
+        second = asyncio.run(generate_response(prompt))
+
+        self.assertEqual(first, second)
+        self.mock_completion.assert_called_once()
+
+    def test_exact_cache_miss_on_different_prompt(self):
+        """Test that different prompts do not share a cache entry."""
+        Config.ENABLE_PROMPT_CACHE = True
+
+        asyncio.run(generate_response(self._prompt("First question")))
+        asyncio.run(generate_response(self._prompt("Second question")))
+
+        self.assertEqual(self.mock_completion.call_count, 2)
+
+    def test_exact_cache_lru_eviction(self):
+        """Test that the oldest entry is evicted once the cache is full."""
+        Config.ENABLE_PROMPT_CACHE = True
+        original_cap = llm._CACHE_MAX_ENTRIES
+        llm._CACHE_MAX_ENTRIES = 2
+        try:
+            asyncio.run(generate_response(self._prompt("A")))
+            asyncio.run(generate_response(self._prompt("B")))
+            asyncio.run(generate_response(self._prompt("C")))  # evicts A
+
+            self.assertEqual(len(llm._exact_cache), 2)
+
+            # A was evicted, so asking it again costs a fourth LLM call
+            asyncio.run(generate_response(self._prompt("A")))
+            self.assertEqual(self.mock_completion.call_count, 4)
+        finally:
+            llm._CACHE_MAX_ENTRIES = original_cap
+
+    def test_clear_response_cache(self):
+        """Test that clearing the cache forces a fresh LLM call."""
+        Config.ENABLE_PROMPT_CACHE = True
+
+        prompt = self._prompt("Cached question")
+        asyncio.run(generate_response(prompt))
+        llm.clear_response_cache()
+        asyncio.run(generate_response(prompt))
+
+        self.assertEqual(self.mock_completion.call_count, 2)
+        self.assertEqual(len(llm._exact_cache), 1)
+
+    def test_semantic_cache_bounded(self):
+        """Test that the semantic tier evicts its oldest entry at the cap."""
+
+        class FakeEmbedder:
+            def encode(self, text):
+                return [float(len(text)), 1.0]
+
+        original_embedder = llm._embedder
+        original_cap = llm._SEMANTIC_CACHE_MAX_ENTRIES
+        llm._embedder = FakeEmbedder()
+        llm._SEMANTIC_CACHE_MAX_ENTRIES = 3
+        try:
+            for i in range(5):
+                llm._semantic_cache_put(f"question {i}", f"answer {i}")
+
+            self.assertEqual(len(llm._semantic_cache), 3)
+            # Oldest entries were dropped first
+            self.assertEqual(llm._semantic_cache[0][1], "answer 2")
+            self.assertEqual(llm._semantic_cache[-1][1], "answer 4")
+        finally:
+            llm._embedder = original_embedder
+            llm._SEMANTIC_CACHE_MAX_ENTRIES = original_cap
+
+
+class _FakeStream:
+    """Async iterator over a fixed list of streaming chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._chunks:
+            raise StopAsyncIteration
+        return self._chunks.pop(0)
+
+
+class FakeStreamingAcompletion:
+    """Streaming counterpart to FakeAcompletion: returns an async chunk iterator."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.call_kwargs = None
+
+    async def __call__(self, *args, **kwargs):
+        self.call_kwargs = kwargs
+        return _FakeStream(self.chunks)
+
+
+def _text_chunk(content):
+    """Build a streaming chunk carrying a text delta."""
+    delta = SimpleNamespace(content=content, tool_calls=None)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+def _tool_chunk(name=None, arguments=None):
+    """Build a streaming chunk carrying a tool-call delta."""
+    call = SimpleNamespace(function=SimpleNamespace(name=name, arguments=arguments))
+    delta = SimpleNamespace(content=None, tool_calls=[call])
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+async def _collect(agen):
+    """Drain an async generator into a list."""
+    return [item async for item in agen]
+
+
+class TestGenerateResponseStream(LLMMockedTestCase):
+    """Test generate_response_stream against a fake async chunk stream."""
+
+    def setUp(self):
+        """Remember the module-level acompletion so each test can swap its own fake in."""
+        super().setUp()
+        self._orig_acompletion = llm.acompletion
+
+    def tearDown(self):
+        """Put the shared session fake back for the other test classes."""
+        llm.acompletion = self._orig_acompletion
+        super().tearDown()
+
+    def _stream(self, chunks, tools=None):
+        fake = FakeStreamingAcompletion(chunks)
+        llm.acompletion = fake
+        prompt = Prompt(messages=[{"role": "user", "content": "Stream it"}], tools=tools or [], metadata={})
+        return fake, asyncio.run(_collect(llm.generate_response_stream(prompt)))
+
+    def test_stream_yields_text_chunks(self):
+        """Test that text deltas are yielded one by one as they arrive."""
+        chunks = [_text_chunk("Hel"), _text_chunk("lo"), _text_chunk(" world")]
+
+        fake, results = self._stream(chunks)
+
+        self.assertEqual(results, ["Hel", "lo", " world"])
+        self.assertTrue(fake.call_kwargs["stream"])
+
+    def test_stream_accumulates_tool_call(self):
+        """Test that a name-first, fragmented tool call is yielded as one JSON string."""
+        tools = [{"type": "function", "function": {"name": "add", "parameters": {}}}]
+        chunks = [_tool_chunk(name="add"), _tool_chunk(arguments='{"a"'), _tool_chunk(arguments=": 1}")]
+
+        fake, results = self._stream(chunks, tools)
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(json.loads(results[0]), {"tool": "add", "args": {"a": 1}})
+        self.assertEqual(fake.call_kwargs["tools"], tools)
+
+    def test_stream_tool_call_without_arguments(self):
+        """Test that a tool call with no argument fragments yields empty args."""
+        tools = [{"type": "function", "function": {"name": "ping", "parameters": {}}}]
+        chunks = [_tool_chunk(name="ping")]
+
+        _, results = self._stream(chunks, tools)
+
+        self.assertEqual(json.loads(results[0]), {"tool": "ping", "args": {}})
+
+    def test_stream_mixes_text_and_tool_call(self):
+        """Test that leading text is streamed before the final tool-call JSON."""
+        tools = [{"type": "function", "function": {"name": "add", "parameters": {}}}]
+        chunks = [_text_chunk("Calculating..."), _tool_chunk(name="add"), _tool_chunk(arguments='{"a": 2}')]
+
+        _, results = self._stream(chunks, tools)
+
+        self.assertEqual(results[0], "Calculating...")
+        self.assertEqual(json.loads(results[1]), {"tool": "add", "args": {"a": 2}})
 
 
-class TestMockingInfrastructure(BaseTestCase):
+class TestMockingInfrastructure(LLMMockedTestCase):
     """Test that the mocking infrastructure works correctly."""
 
     def test_config_mock_setting(self):
         """Test that LLM mocking is enabled in test environment."""
-        # Debug the configuration values
-        print(f"Config.MOCK_LLM_CALLS: {Config.MOCK_LLM_CALLS}")
-        print(f"Environment variable MOCK_LLM_CALLS: {os.environ.get('MOCK_LLM_CALLS')}")
-        print(f"sys.modules with 'tests': {[m for m in sys.modules.keys() if 'tests' in m]}")
+        # Diagnostics are only emitted under --log-cli-level=DEBUG so the
+        # default run pays no stdout-capture cost
+        logger.debug("Config.MOCK_LLM_CALLS: %s", Config.MOCK_LLM_CALLS)
+        logger.debug("Environment variable MOCK_LLM_CALLS: %s", os.environ.get("MOCK_LLM_CALLS"))
+        logger.debug("sys.modules with 'tests': %s", [m for m in sys.modules if "tests" in m])
 
         self.assertTrue(Config.MOCK_LLM_CALLS)
 
@@ -164,7 +370,7 @@ class TestMockingInfrastructure(BaseTestCase):
         self.assertIn("3", mock_tool_call.function.arguments)
 
     def test_base_test_case_setup(self):
-        """Test that BaseTestCase sets up mocking correctly."""
+        """Test that LLMMockedTestCase sets up mocking correctly."""
         # Verify that we have a mock set up
         self.assertTrue(hasattr(self, "mock_completion"))
         self.assertIsNotNone(self.mock_completion)
@@ -173,7 +379,7 @@ class TestMockingInfrastructure(BaseTestCase):
         self.assertTrue(Config.MOCK_LLM_CALLS)
 
 
-class TestPromptDataStructure(BaseTestCase):
+class TestPromptDataStructure(unittest.TestCase):
     """Test Prompt dataclass structure compatibility with LLM calls."""
 
     def test_empty_prompt_creation(self):
@@ -4,40 +4,74 @@ Pre-push validation script for the AI Agent Framework.
 Run this script before pushing code to ensure it will pass the CI/CD pipeline.
 """
 
-import sys
+import shlex
 import subprocess
-import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Resolved once at import; every check runs from the project root
+_HERE = Path(__file__).resolve().parent
+_VENV_PYTHON = _HERE / ".venv" / "bin" / "python"
+
+
+# Keep at most 1 MB of a check's output; verbose runners like
+# 'unittest discover -v' can otherwise hold tens of MB in memory
+_CAPTURE_LIMIT = 1024 * 1024
+
+
+def _read_limited(stream, limit: int = _CAPTURE_LIMIT) -> tuple:
+    """Drain a pipe, keeping at most `limit` bytes; returns (bytes, truncated)."""
+    buffer = bytearray()
+    truncated = False
+    while True:
+        chunk = stream.read(65536)
+        if not chunk:
+            break
+        remaining = limit - len(buffer)
+        if len(chunk) > remaining:
+            truncated = True
+        if remaining > 0:
+            buffer.extend(chunk[:remaining])
+    return bytes(buffer), truncated
+
+
+def run_command(command: str, description: str, capture_on_success: bool = False) -> tuple:
+    """Run a command and return (success, report text).
+
+    Output is buffered as bytes with a 1 MB cap and only decoded when the
+    check fails (or capture_on_success is set), so passing checks cost no
+    text decoding and bounded memory.
+    """
+    lines = [f"\n🔍 {description}", f"Running: {command}"]
 
-def run_command(command: str, description: str) -> bool:
-    """Run a command and return True if successful."""
-    print(f"\n🔍 {description}")
-    print(f"Running: {command}")
-    
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            cwd=Path(__file__).parent,
-            capture_output=True,
-            text=True
+        process = subprocess.Popen(
+            shlex.split(command),
+            cwd=_HERE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT
         )
-        
-        if result.returncode == 0:
-            print(f"✅ {description} passed")
-            return True
+        output, truncated = _read_limited(process.stdout)
+        returncode = process.wait()
+
+        if returncode == 0:
+            lines.append(f"✅ {description} passed")
+            if capture_on_success and output:
+                lines.append(output.decode("utf-8", errors="replace"))
+            return True, "\n".join(lines)
         else:
-            print(f"❌ {description} failed")
-            if result.stdout:
-                print(f"STDOUT:\n{result.stdout}")
-            if result.stderr:
-                print(f"STDERR:\n{result.stderr}")
-            return False
-            
+            lines.append(f"❌ {description} failed")
+            if output:
+                text = output.decode("utf-8", errors="replace")
+                if truncated:
+                    text += "\n[output truncated]"
+                lines.append(f"OUTPUT:\n{text}")
+            return False, "\n".join(lines)
+
     except Exception as e:
-        print(f"❌ Error running {description}: {e}")
-        return False
+        lines.append(f"❌ Error running {description}: {e}")
+        return False, "\n".join(lines)
 
 
 def check_environment() -> bool:
@@ -45,16 +79,13 @@ def check_environment() -> bool:
     print("\n🔧 Checking environment setup...")
     
     # Check if virtual environment exists
-    venv_path = Path(__file__).parent / ".venv"
-    if venv_path.exists():
-        python_cmd = str(venv_path / "bin" / "python")
-        print(f"✅ Using virtual environment: {python_cmd}")
+    if _VENV_PYTHON.exists():
+        print(f"✅ Using virtual environment: {_VENV_PYTHON}")
     else:
-        python_cmd = "python"
         print("⚠️  No virtual environment found, using system Python")
-    
+
     # Check if requirements.txt exists
-    requirements_path = Path(__file__).parent / "requirements.txt"
+    requirements_path = _HERE / "requirements.txt"
     if not requirements_path.exists():
         print("❌ requirements.txt not found")
         return False
@@ -74,21 +105,19 @@ def main():
         return 1
     
     # Find Python executable
-    venv_python = Path(__file__).parent / ".venv" / "bin" / "python"
-    if venv_python.exists():
-        python_cmd = str(venv_python)
-    else:
-        python_cmd = "python"
+    python_cmd = str(_VENV_PYTHON) if _VENV_PYTHON.exists() else "python"
     
-    # Define validation checks (same as CI/CD pipeline)
+    # Define validation checks (same as CI/CD pipeline). The test suite and
+    # import validation share one interpreter via _run_checks.py instead of
+    # paying Python startup and project imports per check.
     checks = [
         # Core quality checks
         (f"{python_cmd} quality_check.py", 
          "Code Quality Checks (flake8, black, isort)"),
         
-        # Test suite
-        (f"{python_cmd} -m unittest discover tests/ -v", 
-         "Unit Test Suite"),
+        # Test suite + package validation in one process
+        (f"{python_cmd} _run_checks.py", 
+         "Unit Test Suite + Package Import Validation"),
         
         # Security checks
         (f"{python_cmd} -m safety check -r requirements.txt", 
@@ -96,18 +125,19 @@ def main():
         
         (f"{python_cmd} -m bandit -r src/ -q", 
          "Security Linting (Bandit)"),
-        
-        # Package validation
-        (f"{python_cmd} -c \"from src import main, models, tools, config; print('All imports successful')\"", 
-         "Package Import Validation"),
     ]
     
     print(f"\n📋 Running {len(checks)} validation checks...")
     
+    # The checks are independent subprocesses, so run them concurrently and
+    # report in submission order; wall time is the slowest check, not the sum
     results = []
-    for command, description in checks:
-        success = run_command(command, description)
-        results.append((description, success))
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [executor.submit(run_command, command, description) for command, description in checks]
+        for (command, description), future in zip(checks, futures):
+            success, report = future.result()
+            print(report)
+            results.append((description, success))
     
     # Summary
     print("\n" + "=" * 60)